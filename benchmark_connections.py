@@ -0,0 +1,71 @@
+"""Compare memory use and load time of raw connection dicts against Connection records.
+
+Usage: python benchmark_connections.py [count]
+"""
+import sys
+import json
+import gc
+import time
+import tracemalloc
+
+from tlcm import Connection
+
+REQUIRED_FIELDS = ['name', 'server', 'username', 'auth_type']
+
+def make_payload(count):
+    connections = []
+    for i in range(count):
+        if i % 2:
+            connections.append({"name": f"Connection {i}", "server": f"tl{i % 50}.example.com",
+                                "username": f"user{i}", "auth_type": "SSH Key",
+                                "auth_data": f"/home/user{i}/.ssh/id_ed25519", "auto_connect": True})
+        else:
+            connections.append({"name": f"Connection {i}", "server": f"tl{i % 50}.example.com",
+                                "username": f"user{i}", "auth_type": "Password",
+                                "auth_data": "", "auto_connect": False})
+    return json.dumps(connections)
+
+def load_dicts(payload):
+    # The load path before Connection: raw dicts with only a required-key check
+    connections = json.loads(payload)
+    if not isinstance(connections, list):
+        raise ValueError("connections.json does not contain a list")
+    for i, conn in enumerate(connections):
+        missing_fields = [field for field in REQUIRED_FIELDS if field not in conn]
+        if missing_fields:
+            raise ValueError(f"Connection {i+1} is missing required fields: {', '.join(missing_fields)}")
+    return connections
+
+def load_records(payload):
+    return Connection.load_all(json.loads(payload))
+
+def measure(loader, payload, repeat=7):
+    elapsed = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        loader(payload)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    tracemalloc.start()
+    result = loader(payload)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return elapsed, retained
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    payload = make_payload(count)
+
+    dict_time, dict_memory = measure(load_dicts, payload)
+    record_time, record_memory = measure(load_records, payload)
+
+    print(f"{count} connections")
+    print(f"  dict:       {dict_time * 1000:8.1f} ms  {dict_memory / 1024 / 1024:8.1f} MiB")
+    print(f"  Connection: {record_time * 1000:8.1f} ms  {record_memory / 1024 / 1024:8.1f} MiB")
+    print(f"  memory saved: {(1 - record_memory / dict_memory) * 100:.1f}%")
+    print(f"  load time change: {(record_time / dict_time - 1) * 100:+.1f}% (best of 7 runs each)")
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,11 @@ import subprocess
 import platform
 import json
 import os
+import io
+import hashlib
+import uuid
+import zipfile
+from enum import Enum
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QMenuBar, QMessageBox, 
                             QDialog, QVBoxLayout, QLabel, QAction, QLineEdit,
                             QComboBox, QFormLayout, QFileDialog, QPushButton,
@@ -12,6 +17,445 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QMenuBar, QMessageBox,
 from PyQt5.QtGui import QKeySequence, QIcon
 from PyQt5.QtCore import QSettings, Qt, QSize, QPoint, QRect
 
+CONNECTIONS_FILE = 'connections.json'
+SYNC_STATE_FILE = 'sync_state.json'
+BUNDLE_MANIFEST = 'manifest.json'
+BUNDLE_VERSION = 1
+# Sync state of a record that has never been synced, matches no real digest
+NO_SYNC_STATE = {"connection": "", "config": ""}
+# Settings launch_connection writes into the config from the connection itself
+LAUNCH_SETTINGS = ('LOGIN_NAME', 'SERVER_NAME', 'AUTHENTICATION_METHOD', 'PRIVATE_KEY')
+LAUNCH_SETTING_PREFIXES = tuple(f"{key}=" for key in LAUNCH_SETTINGS)
+
+class AuthType(Enum):
+    PASSWORD = "Password"
+    SSH_KEY = "SSH Key"
+
+# Lookup by stored value, much cheaper than calling AuthType() for every record
+AUTH_TYPES = {auth_type.value: auth_type for auth_type in AuthType}
+
+class Connection:
+    """A single ThinLinc connection, validated once when it is created."""
+    __slots__ = ('name', 'server', 'username', 'auth_type', 'auth_data', 'auto_connect')
+
+    REQUIRED_FIELDS = ('name', 'server', 'username', 'auth_type')
+
+    def __init__(self, name, server, username, auth_type, auth_data="", auto_connect=False):
+        # User input may carry stray whitespace, values read from disk are already clean
+        if isinstance(name, str):
+            name = name.strip()
+        if isinstance(server, str):
+            server = server.strip()
+        if isinstance(username, str):
+            username = username.strip()
+        self._set(name, server, username, auth_type, auth_data, auto_connect)
+
+    def _set(self, name, server, username, auth_type, auth_data, auto_connect):
+        if type(name) is not str:
+            raise ValueError("Name must be a string")
+        if not name:
+            raise ValueError("Name is required")
+        if type(server) is not str:
+            raise ValueError("Server must be a string")
+        if not server:
+            raise ValueError("Server is required")
+        if type(username) is not str:
+            raise ValueError("Username must be a string")
+        if not username:
+            raise ValueError("Username is required")
+        if type(auth_type) is str and auth_type in AUTH_TYPES:
+            auth_type = AUTH_TYPES[auth_type]
+        elif not isinstance(auth_type, AuthType):
+            raise ValueError(f"Unknown authentication type: {auth_type!r}")
+        if type(auth_data) is not str:
+            raise ValueError("SSH Key path must be a string")
+        if type(auto_connect) is not bool:
+            raise ValueError("Auto connect must be true or false")
+
+        if auth_type is AuthType.SSH_KEY:
+            if not auth_data:
+                raise ValueError("SSH Key path is required")
+        else:
+            # Password connections carry no key and can never auto connect
+            auth_data = ""
+            auto_connect = False
+
+        self.name = name
+        self.server = server
+        self.username = username
+        self.auth_type = auth_type
+        self.auth_data = auth_data
+        self.auto_connect = auto_connect
+
+    @classmethod
+    def from_dict(cls, data):
+        """Build a connection from the connections.json schema without re-stripping fields."""
+        try:
+            name = data['name']
+            server = data['server']
+            username = data['username']
+            auth_type = data['auth_type']
+        except KeyError:
+            missing_fields = [field for field in cls.REQUIRED_FIELDS if field not in data]
+            raise ValueError(f"missing required fields: {', '.join(missing_fields)}")
+        conn = cls.__new__(cls)
+        conn._set(name, server, username, auth_type,
+                  data.get('auth_data', ""), data.get('auto_connect', False))
+        return conn
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "server": self.server,
+            "username": self.username,
+            "auth_type": self.auth_type.value,
+            "auth_data": self.auth_data,
+            "auto_connect": self.auto_connect
+        }
+
+    @classmethod
+    def load_all(cls, data):
+        """Convert the decoded connections.json list into Connection records."""
+        if not isinstance(data, list):
+            raise ValueError("connections.json does not contain a list")
+        from_dict = cls.from_dict
+        try:
+            return [from_dict(conn) for conn in data]
+        except (ValueError, TypeError) as e:
+            # Only walk the list again to find which record failed
+            for i, conn in enumerate(data):
+                if not isinstance(conn, dict):
+                    raise ValueError(f"Connection {i+1} is not an object")
+                try:
+                    from_dict(conn)
+                except ValueError as record_error:
+                    raise ValueError(f"Connection {i+1} is invalid: {str(record_error)}")
+            raise ValueError(str(e))
+
+    @staticmethod
+    def dump_all(connections):
+        """Convert Connection records back into the connections.json schema."""
+        return [conn.to_dict() for conn in connections]
+
+    @property
+    def config_name(self):
+        return f"tlclient_{self.name.replace(' ', '_')}.conf"
+
+    def __repr__(self):
+        return f"Connection(name={self.name!r}, server={self.server!r}, auth_type={self.auth_type.value!r})"
+
+def atomic_write(path, data):
+    """Write a file through a temporary file, so readers never see it half written."""
+    directory, base_name = os.path.split(os.path.abspath(path))
+    tmp_path = os.path.join(directory, f".{base_name}.{platform.node()}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'wb' if isinstance(data, bytes) else 'w') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def read_connections(path=CONNECTIONS_FILE):
+    """Load all connections from disk, returning an empty list if the file does not exist."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return Connection.load_all(json.load(f))
+
+def write_connections(connections, path=CONNECTIONS_FILE):
+    atomic_write(path, json.dumps(Connection.dump_all(connections), indent=4))
+
+def read_config(connection):
+    """Return the saved tlclient config for a connection, or None if it has none yet."""
+    if not os.path.exists(connection.config_name):
+        return None
+    with open(connection.config_name, 'r') as f:
+        return f.read()
+
+def synced_config(config):
+    """Strip the settings launch_connection rewrites from the connection on every launch.
+
+    Launching a connection (and tlclient saving its session) must not make
+    the record look edited, so only the remaining settings are synced.
+    """
+    if config is None:
+        return None
+    return ''.join(line for line in config.splitlines(keepends=True)
+                   if not line.startswith(LAUNCH_SETTING_PREFIXES))
+
+def content_hash(data):
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+def connection_blob(connection):
+    return json.dumps(connection.to_dict(), sort_keys=True, separators=(',', ':'))
+
+def local_records():
+    """Map each local connection name to its (connection, synced config, digest) triple.
+
+    The digest holds separate hashes for the connection and its config, so a
+    config-only change can be told apart from an edit of the connection.
+    """
+    records = {}
+    for conn in read_connections():
+        if conn.name in records:
+            # Records are matched by name, a duplicate would be dropped on sync
+            raise ValueError(f"Duplicate connection name '{conn.name}', "
+                             "rename one of them before syncing")
+        config = synced_config(read_config(conn))
+        digest = {"connection": content_hash(connection_blob(conn)),
+                  "config": content_hash(config) if config is not None else None}
+        records[conn.name] = (conn, config, digest)
+    return records
+
+def read_sync_states():
+    if not os.path.exists(SYNC_STATE_FILE):
+        return {}
+    with open(SYNC_STATE_FILE, 'r') as f:
+        state = json.load(f)
+    bundles = state.get("bundles") if isinstance(state, dict) else None
+    return bundles if isinstance(bundles, dict) else {}
+
+def read_sync_state(bundle_id):
+    """Return the record digests as of the last export to or import from a bundle.
+
+    A bundle this machine has never synced with has an empty state.
+    """
+    records = read_sync_states().get(bundle_id)
+    if not isinstance(records, dict):
+        return {}
+    return {name: digest for name, digest in records.items() if isinstance(digest, dict)}
+
+def write_sync_state(bundle_id, records):
+    bundles = read_sync_states()
+    bundles[bundle_id] = records
+    atomic_write(SYNC_STATE_FILE, json.dumps({"bundles": bundles}, indent=4, sort_keys=True))
+
+def read_manifest(bundle):
+    """Read and check the manifest of an open bundle, returning its id and record digests."""
+    manifest = json.loads(bundle.read(BUNDLE_MANIFEST))
+    if not isinstance(manifest, dict) or manifest.get("version") != BUNDLE_VERSION:
+        raise ValueError("Unsupported bundle version")
+    bundle_id = manifest.get("bundle_id")
+    if not isinstance(bundle_id, str) or not bundle_id:
+        raise ValueError("Bundle manifest has no bundle id")
+    records = manifest.get("records")
+    if not isinstance(records, dict):
+        raise ValueError("Bundle manifest has no record list")
+    for name, digest in records.items():
+        if (not isinstance(digest, dict)
+                or not isinstance(digest.get("connection"), str)
+                or not isinstance(digest.get("config"), (str, type(None)))):
+            raise ValueError(f"Bundle manifest entry for '{name}' is invalid")
+    return bundle_id, records
+
+class SyncResult:
+    """Outcome of exporting or importing a bundle, per connection name."""
+    __slots__ = ('added', 'updated', 'deleted', 'unchanged', 'conflicts')
+
+    def __init__(self):
+        self.added = []
+        self.updated = []
+        self.deleted = []
+        self.unchanged = []
+        self.conflicts = []  # (name, reason) pairs
+
+    def summary(self):
+        lines = [f"Added: {len(self.added)}",
+                 f"Updated: {len(self.updated)}",
+                 f"Deleted: {len(self.deleted)}",
+                 f"Unchanged: {len(self.unchanged)}"]
+        if self.conflicts:
+            lines.append(f"\nConflicts ({len(self.conflicts)}):")
+            lines.extend(f"  {name}: {reason}" for name, reason in self.conflicts)
+        return '\n'.join(lines)
+
+def export_bundle(path, force=False):
+    """Write all connections and their configs to a compressed bundle.
+
+    Connections and configs are stored under their content hash and listed in
+    the manifest, so an import only has to read what it does not have yet.
+    If the bundle at path holds changes this machine has not imported, those
+    records are returned as conflicts and nothing is written, unless force is
+    set to overwrite them with the local versions.
+
+    The bundle is a single zip that is replaced as a whole, so readers on a
+    shared folder never see it half written. Only the import side is
+    proportional to what changed; an export still rewrites every record,
+    although it is skipped entirely when nothing changed.
+    """
+    result = SyncResult()
+    local = local_records()
+    local_digests = {name: digest for name, (_, _, digest) in local.items()}
+
+    if os.path.exists(path):
+        with zipfile.ZipFile(path, 'r') as bundle:
+            bundle_id, remote = read_manifest(bundle)
+    else:
+        # A new bundle starts with no shared history
+        bundle_id, remote = uuid.uuid4().hex, {}
+    base = read_sync_state(bundle_id)
+
+    for name in sorted(set(remote) | set(base)):
+        remote_digest = remote.get(name)
+        if remote_digest != base.get(name) and remote_digest != local_digests.get(name):
+            result.conflicts.append((name, "changed in bundle since the last sync, import first"))
+    if result.conflicts:
+        if not force:
+            return result
+        result.conflicts = [(name, "bundle changes overwritten with the local version")
+                            for name, _ in result.conflicts]
+
+    for name, digest in local_digests.items():
+        if name not in remote:
+            result.added.append(name)
+        elif remote[name] != digest:
+            result.updated.append(name)
+        else:
+            result.unchanged.append(name)
+    result.deleted = [name for name in remote if name not in local_digests]
+
+    if result.added or result.updated or result.deleted or not os.path.exists(path):
+        manifest = {"version": BUNDLE_VERSION, "bundle_id": bundle_id, "records": local_digests}
+        data = io.BytesIO()
+        with zipfile.ZipFile(data, 'w', zipfile.ZIP_DEFLATED) as bundle:
+            bundle.writestr(BUNDLE_MANIFEST, json.dumps(manifest, indent=4, sort_keys=True))
+            written = set()
+            for conn, config, digest in local.values():
+                blobs = [(f"connections/{digest['connection']}.json", connection_blob(conn))]
+                if config is not None:
+                    blobs.append((f"configs/{digest['config']}.conf", config))
+                for member, blob in blobs:
+                    if member not in written:
+                        bundle.writestr(member, blob)
+                        written.add(member)
+        atomic_write(path, data.getvalue())
+
+    # Every record in the bundle now matches the local state
+    write_sync_state(bundle_id, local_digests)
+    return result
+
+def read_blob(bundle, member, expected_hash):
+    data = bundle.read(member).decode('utf-8')
+    if content_hash(data) != expected_hash:
+        raise ValueError(f"{member} does not match its hash")
+    return data
+
+def import_bundle(path):
+    """Apply the parts of a bundle that differ from the local state.
+
+    The connection and its config are compared separately against the sync
+    state from the last export to or import from this bundle, which tells
+    which side changed them. A connection changed on both sides is reported
+    as a conflict and left untouched. For a config changed on both sides the
+    local config is kept. Every record is read and checked before anything
+    is written.
+    """
+    result = SyncResult()
+    local = local_records()
+    connections = {name: conn for name, (conn, _, _) in local.items()}
+    config_writes = {}  # config file name -> new contents, None to remove it
+
+    with zipfile.ZipFile(path, 'r') as bundle:
+        bundle_id, remote = read_manifest(bundle)
+        base = read_sync_state(bundle_id)
+
+        for name, remote_digest in remote.items():
+            base_digest = base.get(name, NO_SYNC_STATE)
+
+            if name not in local:
+                if name in base:
+                    if remote_digest["connection"] != base_digest["connection"]:
+                        result.conflicts.append((name, "deleted locally but changed in bundle"))
+                    continue
+                local_digest = NO_SYNC_STATE
+            else:
+                local_digest = local[name][2]
+                if local_digest == remote_digest:
+                    result.unchanged.append(name)
+                    base[name] = remote_digest
+                    continue
+
+            # Decide for each part whether the bundle side should be applied
+            state = {}
+            apply_parts = []
+            notes = []
+            for part in ("connection", "config"):
+                if local_digest[part] == remote_digest[part]:
+                    state[part] = remote_digest[part]
+                elif remote_digest[part] == base_digest[part]:
+                    state[part] = base_digest[part]  # Only changed locally
+                elif local_digest[part] == base_digest[part]:
+                    state[part] = remote_digest[part]
+                    apply_parts.append(part)
+                elif part == "connection":
+                    state[part] = base_digest[part]
+                    notes.append("changed both locally and in bundle")
+                else:
+                    # The connection itself is unaffected, keep the local settings
+                    state[part] = remote_digest[part]
+                    notes.append("tlclient config changed both locally and in bundle, kept the local config")
+
+            # Read and check everything this record needs before staging it
+            try:
+                conn = connections.get(name)
+                config = None
+                if "connection" in apply_parts:
+                    data = json.loads(read_blob(bundle, f"connections/{remote_digest['connection']}.json",
+                                                remote_digest["connection"]))
+                    if not isinstance(data, dict):
+                        raise ValueError("connection is not an object")
+                    conn = Connection.from_dict(data)
+                    if conn.name != name:
+                        raise ValueError("connection name does not match the manifest")
+                    if os.path.basename(conn.config_name) != conn.config_name:
+                        raise ValueError("name cannot be used as a config file name")
+                if "config" in apply_parts and remote_digest["config"] is not None:
+                    config = read_blob(bundle, f"configs/{remote_digest['config']}.conf",
+                                       remote_digest["config"])
+            except (KeyError, ValueError) as e:
+                result.conflicts.append((name, f"invalid record: {str(e)}"))
+                continue
+
+            if "connection" in apply_parts:
+                (result.updated if name in connections else result.added).append(name)
+                connections[name] = conn
+            elif "config" in apply_parts:
+                result.updated.append(name)
+            if "config" in apply_parts:
+                config_writes[conn.config_name] = config
+            result.conflicts.extend((name, note) for note in notes)
+            base[name] = state
+
+    # Records dropped from the bundle since the last sync with it. Without a
+    # sync state for this bundle nothing counts as deleted.
+    for name, (conn, _, local_digest) in local.items():
+        if name in remote or name not in base:
+            continue
+        if local_digest["connection"] != base[name]["connection"]:
+            result.conflicts.append((name, "changed locally but deleted in bundle"))
+            continue
+        config_writes[conn.config_name] = None
+        del connections[name]
+        del base[name]
+        result.deleted.append(name)
+
+    # Forget names that are gone on both sides
+    for name in list(base):
+        if name not in remote and name not in local:
+            del base[name]
+
+    for config_name, config in config_writes.items():
+        if config is None:
+            if os.path.exists(config_name):
+                os.remove(config_name)
+        else:
+            atomic_write(config_name, config)
+    write_connections(list(connections.values()))
+    write_sync_state(bundle_id, base)
+    return result
+
 class AboutDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -39,7 +483,7 @@ class AddConnectionDialog(QDialog):
         super().__init__(parent)
         self.setWindowTitle("Edit Connection" if connection_data else "Add Connection")
         self.setModal(True)
-        self.original_name = connection_data['name'] if connection_data else None  # Store original name for edit mode
+        self.original_name = connection_data.name if connection_data else None  # Store original name for edit mode
         
         layout = QFormLayout()
         
@@ -57,7 +501,7 @@ class AddConnectionDialog(QDialog):
         
         # Authentication type combo
         self.auth_type = QComboBox()
-        self.auth_type.addItems(["Password", "SSH Key"])
+        self.auth_type.addItems([auth_type.value for auth_type in AuthType])
         self.auth_type.currentTextChanged.connect(self.on_auth_type_changed)
         layout.addRow("Authentication:", self.auth_type)
         
@@ -101,22 +545,22 @@ class AddConnectionDialog(QDialog):
         
         # If editing, populate fields with existing data
         if connection_data:
-            self.name_edit.setText(connection_data['name'])
-            self.server_edit.setText(connection_data['server'])
-            self.username_edit.setText(connection_data['username'])
+            self.name_edit.setText(connection_data.name)
+            self.server_edit.setText(connection_data.server)
+            self.username_edit.setText(connection_data.username)
             
             # Set auth type
-            index = self.auth_type.findText(connection_data['auth_type'])
+            index = self.auth_type.findText(connection_data.auth_type.value)
             if index >= 0:
                 self.auth_type.setCurrentIndex(index)
             
             # Set auth data
-            if connection_data['auth_type'] == "SSH Key":
-                self.key_path_edit.setText(connection_data['auth_data'])
-                self.auto_connect.setChecked(connection_data.get('auto_connect', False))
+            if connection_data.auth_type is AuthType.SSH_KEY:
+                self.key_path_edit.setText(connection_data.auth_data)
+                self.auto_connect.setChecked(connection_data.auto_connect)
 
     def on_auth_type_changed(self, text):
-        if text == "Password":
+        if text == AuthType.PASSWORD.value:
             self.auth_stack.setCurrentIndex(0)
             self.auto_connect.hide()
             self.auto_connect.setChecked(False)  # Uncheck when hidden
@@ -140,44 +584,26 @@ class AddConnectionDialog(QDialog):
             self.key_path_edit.setText(file_name)
 
     def accept(self):
-        # Validate required fields
-        if not self.name_edit.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Name is required")
-            return
-        if not self.server_edit.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Server is required")
-            return
-        if not self.username_edit.text().strip():
-            QMessageBox.warning(self, "Validation Error", "Username is required")
-            return
-
-        # Validate SSH Key if selected
-        auth_type = self.auth_type.currentText()
-        if auth_type == "SSH Key" and not self.key_path_edit.text():
-            QMessageBox.warning(self, "Validation Error", "SSH Key path is required")
+        # Create and validate connection data
+        try:
+            connection = Connection(self.name_edit.text(),
+                                    self.server_edit.text(),
+                                    self.username_edit.text(),
+                                    self.auth_type.currentText(),
+                                    self.key_path_edit.text(),
+                                    self.auto_connect.isChecked())
+        except ValueError as e:
+            QMessageBox.warning(self, "Validation Error", str(e))
             return
-
-        # Create connection data
-        new_name = self.name_edit.text().strip()
-        connection = {
-            "name": new_name,
-            "server": self.server_edit.text().strip(),
-            "username": self.username_edit.text().strip(),
-            "auth_type": auth_type,
-            "auth_data": self.key_path_edit.text() if auth_type == "SSH Key" else "",
-            "auto_connect": self.auto_connect.isChecked() if auth_type == "SSH Key" else False
-        }
+        new_name = connection.name
 
         try:
             # Load existing connections
-            connections = []
-            if os.path.exists('connections.json'):
-                with open('connections.json', 'r') as f:
-                    connections = json.load(f)
+            connections = read_connections()
 
             # Check for duplicate names only for new connections or if name changed during edit
             if self.original_name is None:  # New connection
-                if any(conn['name'] == new_name for conn in connections):
+                if any(conn.name == new_name for conn in connections):
                     QMessageBox.warning(self, "Validation Error", 
                                       "A connection with this name already exists")
                     return
@@ -186,19 +612,18 @@ class AddConnectionDialog(QDialog):
             else:  # Editing existing connection
                 # Only check for duplicates if name was changed
                 if new_name != self.original_name:
-                    if any(conn['name'] == new_name for conn in connections):
+                    if any(conn.name == new_name for conn in connections):
                         QMessageBox.warning(self, "Validation Error", 
                                           "A connection with this name already exists")
                         return
                 # Update existing connection
                 for i, conn in enumerate(connections):
-                    if conn['name'] == self.original_name:
+                    if conn.name == self.original_name:
                         connections[i] = connection
                         break
 
             # Save back to file
-            with open('connections.json', 'w') as f:
-                json.dump(connections, f, indent=4)
+            write_connections(connections)
 
             super().accept()
 
@@ -219,7 +644,7 @@ class ConnectionWidget(QWidget):
         icon_label.setAlignment(Qt.AlignCenter)
         
         # Name
-        name_label = QLabel(connection_data['name'])
+        name_label = QLabel(connection_data.name)
         name_label.setAlignment(Qt.AlignCenter)
         
         layout.addWidget(icon_label)
@@ -273,7 +698,7 @@ class ConnectionWidget(QWidget):
                 return
             
             # Create config file name
-            config_name = f"tlclient_{self.connection_data['name'].replace(' ', '_')}.conf"
+            config_name = self.connection_data.config_name
             
             # Check if config file exists
             if os.path.exists(config_name):
@@ -287,13 +712,13 @@ class ConnectionWidget(QWidget):
             
             # Update or append settings
             settings = {
-                f"LOGIN_NAME": self.connection_data['username'],
-                f"SERVER_NAME": self.connection_data['server'],
-                f"AUTHENTICATION_METHOD": "publickey" if self.connection_data['auth_type'] == "SSH Key" else "password"
+                f"LOGIN_NAME": self.connection_data.username,
+                f"SERVER_NAME": self.connection_data.server,
+                f"AUTHENTICATION_METHOD": "publickey" if self.connection_data.auth_type is AuthType.SSH_KEY else "password"
             }
             
-            if self.connection_data['auth_type'] == "SSH Key":
-                settings["PRIVATE_KEY"] = self.connection_data['auth_data']
+            if self.connection_data.auth_type is AuthType.SSH_KEY:
+                settings["PRIVATE_KEY"] = self.connection_data.auth_data
             
             # Update each setting in the config
             for key, value in settings.items():
@@ -315,12 +740,12 @@ class ConnectionWidget(QWidget):
             # Launch tlclient based on platform
             if platform.system() == 'Linux':
                 cmd = [tlclient_path, '-C', config_name]
-                if self.connection_data.get('auto_connect', False):
+                if self.connection_data.auto_connect:
                     cmd.extend(['-p', '1'])
                 subprocess.Popen(cmd)
             elif platform.system() == 'Darwin':
                 cmd = ['open', '-n', '-a', 'ThinLinc Client', config_name]
-                if self.connection_data.get('auto_connect', False):
+                if self.connection_data.auto_connect:
                     cmd.extend(['--args', '-p', '1'])
                 subprocess.Popen(cmd)
             else:
@@ -344,28 +769,8 @@ class ConnectionWidget(QWidget):
     def edit_connection(self):
         dialog = AddConnectionDialog(self, self.connection_data)
         if dialog.exec_() == QDialog.Accepted:
-            # Update connection in connections.json
+            # The dialog has already saved the updated connection to connections.json
             try:
-                with open('connections.json', 'r') as f:
-                    connections = json.load(f)
-                
-                # Find and update the connection
-                for i, conn in enumerate(connections):
-                    if conn['name'] == self.connection_data['name']:
-                        connections[i] = {
-                            "name": dialog.name_edit.text().strip(),
-                            "server": dialog.server_edit.text().strip(),
-                            "username": dialog.username_edit.text().strip(),
-                            "auth_type": dialog.auth_type.currentText(),
-                            "auth_data": dialog.key_path_edit.text() if dialog.auth_type.currentText() == "SSH Key" else "",
-                            "auto_connect": dialog.auto_connect.isChecked() if dialog.auth_type.currentText() == "SSH Key" else False
-                        }
-                        break
-                
-                # Save updated connections
-                with open('connections.json', 'w') as f:
-                    json.dump(connections, f, indent=4)
-                
                 # Refresh the main window's connection grid
                 if isinstance(self.parent(), QWidget):
                     main_window = self.parent().window()
@@ -379,28 +784,26 @@ class ConnectionWidget(QWidget):
     def delete_connection(self):
         # Ask for confirmation
         reply = QMessageBox.question(self, "Confirm Delete",
-                                   f"Are you sure you want to delete the connection '{self.connection_data['name']}'?",
+                                   f"Are you sure you want to delete the connection '{self.connection_data.name}'?",
                                    QMessageBox.Yes | QMessageBox.No,
                                    QMessageBox.No)
         
         if reply == QMessageBox.Yes:
             try:
                 # Delete the config file if it exists
-                config_name = f"tlclient_{self.connection_data['name'].replace(' ', '_')}.conf"
+                config_name = self.connection_data.config_name
                 if os.path.exists(config_name):
                     os.remove(config_name)
                 
                 # Remove from connections.json
-                with open('connections.json', 'r') as f:
-                    connections = json.load(f)
+                connections = read_connections()
                 
                 # Filter out the connection to delete
                 connections = [conn for conn in connections 
-                             if conn['name'] != self.connection_data['name']]
+                             if conn.name != self.connection_data.name]
                 
                 # Save updated connections
-                with open('connections.json', 'w') as f:
-                    json.dump(connections, f, indent=4)
+                write_connections(connections)
                 
                 # Refresh the main window's connection grid
                 if isinstance(self.parent(), QWidget):
@@ -456,6 +859,11 @@ class MainWindow(QMainWindow):
         # Add to Connections menu
         connections_menu.addAction(add_action)
         connections_menu.addSeparator()
+        export_action = connections_menu.addAction('&Export Bundle...')
+        export_action.triggered.connect(self.export_bundle)
+        import_action = connections_menu.addAction('&Import Bundle...')
+        import_action.triggered.connect(self.import_bundle)
+        connections_menu.addSeparator()
         quit_action = connections_menu.addAction('&Quit')
         quit_action.setShortcut(QKeySequence('Ctrl+Q'))
         quit_action.triggered.connect(self.close)
@@ -604,23 +1012,13 @@ class MainWindow(QMainWindow):
                 widget.deleteLater()
         
         try:
-            if os.path.exists('connections.json'):
+            if os.path.exists(CONNECTIONS_FILE):
                 try:
-                    with open('connections.json', 'r') as f:
-                        connections = json.load(f)
-                    
-                    # Validate that we got a list
-                    if not isinstance(connections, list):
-                        raise ValueError("connections.json does not contain a list")
+                    # Connections are validated as they are loaded
+                    connections = read_connections()
                     
                     # Add connections to grid
                     for i, conn in enumerate(connections):
-                        # Validate required fields
-                        required_fields = ['name', 'server', 'username', 'auth_type']
-                        missing_fields = [field for field in required_fields if field not in conn]
-                        if missing_fields:
-                            raise ValueError(f"Connection {i+1} is missing required fields: {', '.join(missing_fields)}")
-                        
                         row = i // 4  # 4 connections per row
                         col = i % 4
                         connection_widget = ConnectionWidget(conn)
@@ -638,13 +1036,12 @@ class MainWindow(QMainWindow):
                         # Backup corrupted file
                         backup_name = 'connections.json.backup'
                         try:
-                            os.rename('connections.json', backup_name)
+                            os.rename(CONNECTIONS_FILE, backup_name)
                             QMessageBox.information(self,
                                 "Backup Created",
                                 f"The corrupted file has been backed up as '{backup_name}'")
                             # Create new empty config
-                            with open('connections.json', 'w') as f:
-                                json.dump([], f)
+                            write_connections([])
                         except Exception as backup_error:
                             QMessageBox.critical(self,
                                 "Error",
@@ -670,6 +1067,54 @@ class MainWindow(QMainWindow):
             QMessageBox.information(self, "Success", 
                                   "Connection added successfully!")
 
+    def export_bundle(self):
+        file_name, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Connection Bundle",
+            "connections.tlcm",
+            "TLCM Bundles (*.tlcm);;All Files (*)")
+        if not file_name:
+            return
+        try:
+            result = export_bundle(file_name)
+            if result.conflicts:
+                reply = QMessageBox.warning(self,
+                    "Bundle Has Newer Changes",
+                    "The bundle contains changes that have not been imported yet:\n\n"
+                    + '\n'.join(f"  {name}: {reason}" for name, reason in result.conflicts)
+                    + "\n\nImport the bundle first to keep them, or overwrite these "
+                    "records with the local versions?",
+                    QMessageBox.Yes | QMessageBox.No,
+                    QMessageBox.No)
+                if reply != QMessageBox.Yes:
+                    return
+                result = export_bundle(file_name, force=True)
+            QMessageBox.information(self, "Export Complete",
+                                  f"Exported connections to:\n{file_name}\n\n{result.summary()}")
+        except Exception as e:
+            QMessageBox.critical(self, "Error",
+                               f"Failed to export connections:\n{str(e)}")
+
+    def import_bundle(self):
+        file_name, _ = QFileDialog.getOpenFileName(
+            self,
+            "Import Connection Bundle",
+            "",
+            "TLCM Bundles (*.tlcm);;All Files (*)")
+        if not file_name:
+            return
+        try:
+            result = import_bundle(file_name)
+        except Exception as e:
+            QMessageBox.critical(self, "Error",
+                               f"Failed to import connections:\n{str(e)}")
+            return
+        self.load_connections()
+        if result.conflicts:
+            QMessageBox.warning(self, "Import Completed With Conflicts", result.summary())
+        else:
+            QMessageBox.information(self, "Import Complete", result.summary())
+
 def main():
     app = QApplication(sys.argv)
     